@@ -1,10 +1,12 @@
 """Streamlit front-end for the BioSignal Studio decision helper."""
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
+import numpy as np
 import streamlit as st
 
-from models import apply_bandpass_filter, run_simulation
+from models import SimulationResult, apply_bandpass_filter, run_simulation
 from utils import (
     classify_hr,
     compute_hr_metrics,
@@ -12,6 +14,9 @@ from utils import (
     generate_summary_text,
 )
 
+if TYPE_CHECKING:  # pandas is imported lazily where the chart frames are built
+    import pandas as pd
+
 
 def _sidebar_controls() -> dict:
     """Render the sidebar widgets and return the chosen parameters."""
@@ -52,31 +57,141 @@ def _sidebar_controls() -> dict:
     return params
 
 
-def _plot_signals(time, raw, filtered):
-    """Plot raw/filtered ECG and HR in stacked rows."""
+# Upper bound on entries kept in each per-session cache dict.
+_SESSION_CACHE_LIMIT = 8
+
+
+def _session_memo(name: str, key, compute):
+    """Return ``compute()`` memoized under ``key`` in a bounded per-session dict."""
+
+    cache = st.session_state.setdefault(name, {})
+    if key not in cache:
+        cache[key] = compute()
+        while len(cache) > _SESSION_CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
+    return cache[key]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_simulation(
+    duration_s: float,
+    fs: int,
+    hr_rest: float,
+    hr_peak: float,
+    stress_level: float,
+    noise_level: float,
+    baseline_wander: float,
+    seed: int | None,
+):
+    """Run the simulation once per parameter set and reuse it across reruns.
+
+    Returns the packed ``SimulationResult.data`` array, which pickles as a
+    single buffer.
+    """
+
+    result = run_simulation(
+        duration_s=duration_s,
+        fs=fs,
+        hr_rest=hr_rest,
+        hr_peak=hr_peak,
+        stress_level=stress_level,
+        noise_level=noise_level,
+        baseline_wander=baseline_wander,
+        seed=seed,
+    )
+    return result.data
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_bandpass(_signal_in, sim_key: tuple, fs: float, lowcut: float, highcut: float, order: int):
+    """Filter the raw ECG, keyed by the simulation parameters instead of the samples.
+
+    The raw ECG is a deterministic function of ``sim_key`` (which includes the
+    seed), so hashing the array itself is unnecessary; the leading underscore
+    tells Streamlit to skip it.
+    """
+
+    return apply_bandpass_filter(_signal_in, fs=fs, lowcut=lowcut, highcut=highcut, order=order)
+
+
+def _downsample_for_plot(time, *series, max_points: int = 2000):
+    """Reduce ``time`` and each series to about ``max_points`` samples for plotting.
+
+    Samples are grouped into bins and every bin is represented by its minimum
+    and maximum in the order they occur, so narrow features such as R peaks
+    survive at any zoom level. ``None`` entries in ``series`` pass through.
+    """
 
-    fig, ax = plt.subplots(figsize=(10, 3))
-    ax.plot(time, raw, label="Raw ECG", color="#1f77b4", linewidth=1)
+    n_bins = max(1, max_points // 2)
+    step = -(-time.size // n_bins)
+    if step <= 2:
+        return (time, *series)
+
+    pad = (-time.size) % step
+    t_bins = np.pad(time, (0, pad), mode="edge").reshape(-1, step)
+    t_out = np.column_stack((t_bins[:, 0], t_bins[:, step // 2])).ravel()
+
+    rows = np.arange(t_bins.shape[0])
+    out = []
+    for y in series:
+        if y is None:
+            out.append(None)
+            continue
+        bins = np.pad(y, (0, pad), mode="edge").reshape(-1, step)
+        i_min = bins.argmin(axis=1)
+        i_max = bins.argmax(axis=1)
+        lo, hi = bins[rows, i_min], bins[rows, i_max]
+        min_first = i_min <= i_max
+        pairs = np.column_stack((np.where(min_first, lo, hi), np.where(min_first, hi, lo)))
+        out.append(pairs.ravel())
+    return (t_out, *out)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _signal_frame(_time, _raw, _filtered, key: tuple) -> pd.DataFrame:
+    """Build the decimated ECG chart data once per ``key``.
+
+    ``key`` identifies the simulation and filter settings that produced the
+    arrays, so the arrays themselves are not hashed. The frame is shared
+    across reruns and must be treated as read-only.
+    """
+
+    import pandas as pd
+
+    time, raw, filtered = _downsample_for_plot(_time, _raw, _filtered)
+    columns = {"Raw ECG": raw}
     if filtered is not None:
-        ax.plot(time, filtered, label="Filtered ECG", color="#d62728", linewidth=1)
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Voltage (a.u.)")
-    ax.set_title("Synthetic ECG signal")
-    ax.legend(loc="upper right")
-    ax.grid(alpha=0.2)
-    st.pyplot(fig, clear_figure=True)
+        columns["Filtered ECG"] = filtered
+    return pd.DataFrame(columns, index=pd.Index(time, name="Time (s)"))
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _hr_frame(_time, _hr, key: tuple) -> pd.DataFrame:
+    """Build the decimated heart-rate chart data once per ``key``."""
 
+    import pandas as pd
 
-def _plot_hr(time, hr):
-    """Plot the heart-rate trajectory."""
+    time, hr = _downsample_for_plot(_time, _hr)
+    return pd.DataFrame({"Heart rate": hr}, index=pd.Index(time, name="Time (s)"))
 
-    fig, ax = plt.subplots(figsize=(10, 2.6))
-    ax.plot(time, hr, color="#2ca02c")
-    ax.set_xlabel("Time (s)")
-    ax.set_ylabel("Heart rate (bpm)")
-    ax.set_title("Modeled heart-rate response")
-    ax.grid(alpha=0.2)
-    st.pyplot(fig, clear_figure=True)
+
+def _plot_signals(time, raw, filtered, key: tuple):
+    """Chart raw/filtered ECG as a browser-rendered line chart."""
+
+    df = _signal_frame(time, raw, filtered, key)
+    colors = ["#1f77b4", "#d62728"][: df.shape[1]]
+
+    st.markdown("**Synthetic ECG signal**")
+    st.line_chart(df, x_label="Time (s)", y_label="Voltage (a.u.)", color=colors, height=300)
+
+
+def _plot_hr(time, hr, key: tuple):
+    """Chart the heart-rate trajectory."""
+
+    df = _hr_frame(time, hr, key)
+
+    st.markdown("**Modeled heart-rate response**")
+    st.line_chart(df, x_label="Time (s)", y_label="Heart rate (bpm)", color="#2ca02c", height=260)
 
 
 def main() -> None:
@@ -89,26 +204,36 @@ def main() -> None:
         "ECG stands for electrocardiogram and records the heart's electrical activity. This dashboard is an educational sandbox, not a clinical tool."
     )
 
-    result = run_simulation(
-        duration_s=params["duration"],
-        fs=params["fs"],
-        hr_rest=params["rest_hr"],
-        hr_peak=params["peak_hr"],
-        stress_level=params["stress"],
-        noise_level=params["noise"],
-        baseline_wander=params["baseline"],
-        seed=42,
+    sim_key = (
+        params["duration"],
+        params["fs"],
+        params["rest_hr"],
+        params["peak_hr"],
+        params["stress"],
+        params["noise"],
+        params["baseline"],
+        42,
     )
+    result = SimulationResult.from_array(_cached_simulation(*sim_key))
 
     filtered_signal = None
+    filter_key = None
     if params["apply_filter"]:
         highcut = max(params["highcut"], params["lowcut"] + 1.0)  # keep passband valid
-        filtered_signal = apply_bandpass_filter(
-            result.ecg_raw,
-            fs=params["fs"],
-            lowcut=params["lowcut"],
-            highcut=highcut,
-            order=params["order"],
+        filter_key = (params["lowcut"], highcut, params["order"])
+        # Session-level memo in front of the shared cache: reruns from unrelated
+        # widgets get the same array back without hashing or unpickling.
+        filtered_signal = _session_memo(
+            "_filter_cache",
+            (sim_key, filter_key),
+            lambda: _cached_bandpass(
+                result.ecg_raw,
+                sim_key,
+                fs=params["fs"],
+                lowcut=params["lowcut"],
+                highcut=highcut,
+                order=params["order"],
+            ),
         )
 
     metrics = compute_hr_metrics(result.heart_rate)
@@ -119,8 +244,8 @@ def main() -> None:
 
     with signals_tab:
         st.subheader("Modeled Signals")
-        _plot_signals(result.time, result.ecg_raw, filtered_signal)
-        _plot_hr(result.time, result.heart_rate)
+        _plot_signals(result.time, result.ecg_raw, filtered_signal, (sim_key, filter_key))
+        _plot_hr(result.time, result.heart_rate, sim_key)
         with st.expander("What am I looking at?", expanded=False):
             st.write(
                 "The top plot shows a synthetic ECG that mimics P-QRS-T features with added noise and baseline drift. "
@@ -6,24 +6,75 @@ lightweight so students can trace how each parameter impacts the outputs.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
-from scipy import signal
+
+# SciPy is imported inside the filtering helpers: scipy.signal takes well over
+# half a second to import and is only needed once filtering is switched on.
+
+# Signals at least this long are filtered in the frequency domain by default.
+_FFT_FILTER_MIN_SAMPLES = 10_000
 
 
-@dataclass
 class SimulationResult:
-    """Container for the raw simulation outputs."""
+    """Container for the raw simulation outputs.
+
+    The three traces live in one contiguous ``(3, n_samples)`` float32 array,
+    allocated once; ``time``, ``heart_rate``, and ``ecg_raw`` are row views.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, n_samples: int) -> None:
+        self.data = np.empty((3, n_samples), dtype=np.float32)
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> "SimulationResult":
+        """Wrap an existing ``(3, n_samples)`` array without copying it."""
 
-    time: np.ndarray
-    heart_rate: np.ndarray
-    ecg_raw: np.ndarray
+        if data.ndim != 2 or data.shape[0] != 3:
+            raise ValueError("data must have shape (3, n_samples)")
+        result = cls.__new__(cls)
+        result.data = data
+        return result
 
+    @property
+    def time(self) -> np.ndarray:
+        """Sample times in seconds."""
+        return self.data[0]
 
-def create_time_base(duration_s: float, fs: int = 300) -> np.ndarray:
-    """Return an evenly spaced time vector for the simulation.
+    @property
+    def heart_rate(self) -> np.ndarray:
+        """Heart-rate trajectory in bpm."""
+        return self.data[1]
+
+    @property
+    def ecg_raw(self) -> np.ndarray:
+        """Unfiltered synthetic ECG in arbitrary units."""
+        return self.data[2]
+
+
+def _num_samples(duration_s: float, fs: int) -> int:
+    """Validate the time-base parameters and return the sample count."""
+
+    if duration_s <= 0:
+        raise ValueError("duration_s must be positive")
+    if fs <= 0:
+        raise ValueError("fs must be positive")
+    return int(duration_s * fs)
+
+
+def _check_out(out: np.ndarray, shape: Tuple[int, ...]) -> None:
+    """Reject ``out`` buffers that cannot hold a float32 result of ``shape``."""
+
+    if out.shape != shape or out.dtype != np.float32:
+        raise ValueError(f"out must be a float32 array of shape {shape}")
+
+
+def create_time_base(duration_s: float, fs: int = 300, out: np.ndarray | None = None) -> np.ndarray:
+    """Return an evenly spaced ``float32`` time vector for the simulation.
 
     Parameters
     ----------
@@ -32,15 +83,19 @@ def create_time_base(duration_s: float, fs: int = 300) -> np.ndarray:
     fs : int, optional
         Sampling frequency in Hz. Typical ECG monitors use 250-500 Hz. The
         default of 300 Hz keeps plots smooth without being too heavy.
+    out : numpy.ndarray, optional
+        Preallocated float32 buffer of length ``int(duration_s * fs)`` to
+        fill instead of allocating a new array.
     """
 
-    if duration_s <= 0:
-        raise ValueError("duration_s must be positive")
-    if fs <= 0:
-        raise ValueError("fs must be positive")
-
-    n_samples = int(duration_s * fs)
-    return np.linspace(0, duration_s, n_samples, endpoint=False)
+    n_samples = _num_samples(duration_s, fs)
+    if out is None:
+        out = np.empty(n_samples, dtype=np.float32)
+    else:
+        _check_out(out, (n_samples,))
+    # Same values as np.linspace(0, duration_s, n_samples, endpoint=False).
+    np.multiply(np.arange(n_samples), duration_s / max(n_samples, 1), out=out)
+    return out
 
 
 def simulate_heart_rate(
@@ -49,31 +104,110 @@ def simulate_heart_rate(
     hr_peak: float,
     stress_level: float,
     tau: float = 4.0,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
-    """Generate a smooth heart-rate trajectory using a simple exponential."""
+    """Generate a smooth heart-rate trajectory using a simple exponential.
+
+    ``out``, if given, is a float32 buffer shaped like ``time`` to fill.
+    """
 
     if hr_peak < hr_rest:
         hr_peak = hr_rest
-    stress_frac = np.clip(stress_level / 100.0, 0.0, 1.0)
+    # Plain Python scalars keep the trajectory in the dtype of ``time``.
+    stress_frac = float(np.clip(stress_level / 100.0, 0.0, 1.0))
     target_hr = hr_rest + (hr_peak - hr_rest) * stress_frac
     tau = max(tau, 0.5)
-
-    hr = target_hr - (target_hr - hr_rest) * np.exp(-time / tau)
+    if out is not None:
+        _check_out(out, time.shape)
+
+    # target - (target - rest) * exp(-t / tau), built in a single buffer.
+    hr = np.multiply(time, -1.0 / tau, out=out)
+    np.exp(hr, out=hr)
+    hr *= hr_rest - target_hr
+    hr += target_hr
     return hr
 
 
-def _heartbeat_template(phase: np.ndarray) -> np.ndarray:
-    """Return a simple ECG-like template built from Gaussians in phase space."""
+# P, Q, R, S, T wave centres (rad), widths (rad), and amplitudes (a.u.).
+_WAVE_MU = (0.8, 1.1, 1.2, 1.25, 1.55)
+_WAVE_SIGMA = (0.05, 0.02, 0.01, 0.02, 0.08)
+_WAVE_AMP = (0.1, -0.15, 1.2, -0.25, 0.25)
+# -1 / (2 * sigma**2), so each Gaussian exponent is a single multiply.
+_WAVE_NEG_INV_2S2 = tuple(-1.0 / (2 * sigma**2) for sigma in _WAVE_SIGMA)
+
+
+# Entries in the one-beat lookup table. A power of two lets indices wrap
+# around the beat with a bitmask.
+_TEMPLATE_LUT_SIZE = 4096
+
+
+def _heartbeat_shape(phase: np.ndarray) -> np.ndarray:
+    """Evaluate the Gaussian P-QRS-T beat directly at each phase value.
+
+    The output is ``float32``; ``phase`` may be higher precision and is
+    wrapped to ``[0, 2*pi)`` before narrowing. The five waves are accumulated
+    in place into one output buffer, reusing a single scratch array.
+    """
+
+    phase_mod = np.empty(phase.shape, dtype=np.float32)
+    np.mod(phase, 2 * np.pi, out=phase_mod)
+    out = np.sin(phase_mod)
+    out *= 0.05
+    tmp = np.empty_like(phase_mod)
+    for mu, scale, amp in zip(_WAVE_MU, _WAVE_NEG_INV_2S2, _WAVE_AMP):
+        np.subtract(phase_mod, mu, out=tmp)
+        tmp *= tmp
+        tmp *= scale
+        np.exp(tmp, out=tmp)
+        tmp *= amp
+        out += tmp
+    return out
+
+
+@lru_cache(maxsize=1)
+def _template_lut() -> Tuple[np.ndarray, np.ndarray]:
+    """Return one beat sampled on ``[0, 2*pi)`` and the slope to the next entry."""
+
+    grid = np.arange(_TEMPLATE_LUT_SIZE) * (2 * np.pi / _TEMPLATE_LUT_SIZE)
+    lut = _heartbeat_shape(grid)
+    slope = np.roll(lut, -1) - lut
+    lut.setflags(write=False)
+    slope.setflags(write=False)
+    return lut, slope
+
+
+def _heartbeat_template(phase: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Return a simple ECG-like template built from Gaussians in phase space.
+
+    Every beat has the same shape, so it is evaluated once into a lookup
+    table and each sample is linearly interpolated from it. This replaces
+    five exponentials and a sine per sample with two gathers and a
+    multiply-add. The interpolation error stays below 0.005 a.u.
+    """
+
+    lut, slope = _template_lut()
+    pos = phase * (_TEMPLATE_LUT_SIZE / (2 * np.pi))
+    base = np.floor(pos)
+    pos -= base  # fractional position between table entries
+    idx = base.astype(np.intp)
+    idx &= _TEMPLATE_LUT_SIZE - 1
+
+    out = lut.take(idx, out=out, mode="clip")
+    step = slope.take(idx)
+    step *= pos
+    out += step
+    return out
+
+
+def generate_noise(n_samples: int, seed: int | None = None) -> np.ndarray:
+    """Draw the unit-variance white noise that ``generate_ecg_signal`` scales.
 
-    phase_mod = np.mod(phase, 2 * np.pi)
-    p_wave = 0.1 * np.exp(-((phase_mod - 0.8) ** 2) / (2 * 0.05**2))
-    q_wave = -0.15 * np.exp(-((phase_mod - 1.1) ** 2) / (2 * 0.02**2))
-    r_wave = 1.2 * np.exp(-((phase_mod - 1.2) ** 2) / (2 * 0.01**2))
-    s_wave = -0.25 * np.exp(-((phase_mod - 1.25) ** 2) / (2 * 0.02**2))
-    t_wave = 0.25 * np.exp(-((phase_mod - 1.55) ** 2) / (2 * 0.08**2))
+    Callers that rerun the same ``(seed, n_samples)`` can keep the result and
+    pass it back as ``precomputed_noise`` to skip the draw.
+    """
 
-    base = 0.05 * np.sin(phase_mod)
-    return base + p_wave + q_wave + r_wave + s_wave + t_wave
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal(size=n_samples, dtype=np.float32)
 
 
 def generate_ecg_signal(
@@ -82,47 +216,241 @@ def generate_ecg_signal(
     noise_level: float = 0.05,
     baseline_wander: float = 0.1,
     seed: int | None = None,
+    precomputed_noise: np.ndarray | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
-    """Create a synthetic ECG-like waveform aligned with the heart rate."""
+    """Create a synthetic ECG-like waveform aligned with the heart rate.
+
+    ``precomputed_noise``, if given, must be unit-variance noise matching
+    ``time`` (see ``generate_noise``); ``seed`` is then ignored. ``out``, if
+    given, is a float32 buffer shaped like ``time`` to fill.
+    """
 
     if time.ndim != 1 or heart_rate.ndim != 1:
         raise ValueError("time and heart_rate must be 1D arrays")
     if time.shape != heart_rate.shape:
         raise ValueError("time and heart_rate must match in length")
+    if time.size < 2:
+        raise ValueError("time must contain at least two samples")
+    if precomputed_noise is not None and precomputed_noise.shape != time.shape:
+        raise ValueError("precomputed_noise must match time in length")
+    if out is not None:
+        _check_out(out, time.shape)
+    return _synthesize_ecg(time, heart_rate, noise_level, baseline_wander, seed, precomputed_noise, out)
 
-    dt = np.mean(np.diff(time))
-    fs = 1.0 / dt
-    freq = heart_rate / 60.0
-    phase = np.cumsum(2 * np.pi * freq * dt)
-    template = _heartbeat_template(phase)
 
-    rng = np.random.default_rng(seed)
-    noise = noise_level * rng.standard_normal(size=time.size)
-    baseline = baseline_wander * np.sin(2 * np.pi * 0.2 * time)
+def _unit_drift(time: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Return the unit-amplitude 0.2 Hz respiratory-like drift at ``time``."""
+
+    drift = np.multiply(time, 2 * np.pi * 0.2, out=out, dtype=np.float32)
+    np.sin(drift, out=drift)
+    return drift
+
+
+def _synthesize_ecg(
+    time: np.ndarray,
+    heart_rate: np.ndarray,
+    noise_level: float,
+    baseline_wander: float,
+    seed: int | None,
+    precomputed_noise: np.ndarray | None,
+    out: np.ndarray | None,
+    unit_drift: np.ndarray | None = None,
+) -> np.ndarray:
+    """Body of ``generate_ecg_signal`` for already-validated inputs.
 
-    ecg = template + baseline + noise
+    ``unit_drift`` lets ``run_simulation`` reuse a cached ``_unit_drift(time)``.
+    """
+
+    # The time base is uniform, so the step is exact and the per-sample
+    # 2*pi*dt/60 scale can be applied once after the cumulative sum.
+    # The phase is accumulated in float64: it grows to several hundred radians,
+    # where float32 rounding would visibly smear the narrow QRS complex.
+    dt = float(time[1] - time[0])
+    phase = np.cumsum(heart_rate, dtype=np.float64)
+    phase *= (2.0 * np.pi * dt) / 60.0
+
+    # The template buffer doubles as the output; one scratch buffer holds the
+    # baseline drift and is then refilled with noise, so no sum temporaries.
+    ecg = _heartbeat_template(phase, out=out)
+    scratch = np.empty_like(ecg)
+
+    if unit_drift is None:
+        unit_drift = _unit_drift(time, out=scratch)
+    np.multiply(unit_drift, baseline_wander, out=scratch)
+    ecg += scratch
+
+    if precomputed_noise is None:
+        rng = np.random.default_rng(seed)
+        rng.standard_normal(dtype=np.float32, out=scratch)
+        scratch *= noise_level
+    else:
+        np.multiply(precomputed_noise, noise_level, out=scratch)
+    ecg += scratch
     return ecg
 
 
+@lru_cache(maxsize=64)
+def _design_sos(order: int, low: float, high: float) -> np.ndarray:
+    """Design (once) a Butterworth bandpass in second-order-sections form.
+
+    The returned array is shared between callers and must not be modified.
+    """
+
+    from scipy import signal
+
+    return signal.butter(order, [low, high], btype="bandpass", output="sos")
+
+
+@lru_cache(maxsize=64)
+def _sos_state(order: int, low: float, high: float, dtype: str) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Return the SOS matrix and steady-state ``zi`` in ``dtype``, plus the pad length.
+
+    This is the setup ``sosfiltfilt`` redoes on every call, including a
+    linear solve per section for ``zi``; caching it leaves only the two
+    compiled ``sosfilt`` passes per call. Arrays are shared; do not modify.
+    """
+
+    from scipy import signal
+
+    sos = _design_sos(order, low, high)
+    zi = signal.sosfilt_zi(sos)
+    n_taps = 2 * sos.shape[0] + 1 - min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    return sos.astype(dtype), zi.astype(dtype), 3 * int(n_taps)
+
+
+def _odd_extend(signal_in: np.ndarray, padlen: int) -> np.ndarray:
+    """Extend both ends by point reflection, as ``sosfiltfilt`` pads by default."""
+
+    return np.concatenate(
+        (
+            2 * signal_in[0] - signal_in[padlen:0:-1],
+            signal_in,
+            2 * signal_in[-1] - signal_in[-2 : -(padlen + 2) : -1],
+        )
+    )
+
+
+def _sosfiltfilt(order: int, low: float, high: float, signal_in: np.ndarray) -> np.ndarray:
+    """Forward-backward SOS filtering of a 1D signal, as ``scipy.signal.sosfiltfilt``.
+
+    Callers must ensure ``signal_in`` is longer than the cached pad length.
+    """
+
+    from scipy import signal
+
+    dtype = np.result_type(signal_in.dtype, np.float32)
+    sos, zi, padlen = _sos_state(order, low, high, dtype.str)
+
+    ext = _odd_extend(signal_in.astype(dtype, copy=False), padlen)
+    y, _ = signal.sosfilt(sos, ext, zi=zi * ext[0])
+    y, _ = signal.sosfilt(sos, y[::-1], zi=zi * y[-1])
+    return y[::-1][padlen : padlen + signal_in.shape[-1]]
+
+
+@lru_cache(maxsize=16)
+def _zero_phase_gain(order: int, low: float, high: float, n_fft: int) -> np.ndarray:
+    """Return ``|H|**2`` of the bandpass at the ``rfft`` bins of an ``n_fft`` transform.
+
+    Squaring the magnitude is what a forward-backward pass applies, so
+    multiplying a spectrum by this gain is a zero-phase filter.
+    """
+
+    from scipy import signal
+
+    w = np.arange(n_fft // 2 + 1) * (2 * np.pi / n_fft)
+    _, h = signal.sosfreqz(_design_sos(order, low, high), worN=w)
+    gain = (h.real**2 + h.imag**2).astype(np.float32)
+    gain.setflags(write=False)
+    return gain
+
+
+def _fft_filtfilt(order: int, low: float, high: float, signal_in: np.ndarray) -> np.ndarray:
+    """Zero-phase filter ``signal_in`` in the frequency domain.
+
+    The signal is odd-extended at both ends by the same pad length
+    ``sosfiltfilt`` uses. Away from the edges the result matches
+    ``sosfiltfilt``; within the first and last second both carry start-up
+    transients of similar size, just different ones.
+    """
+
+    from scipy import fft as sp_fft
+
+    dtype = np.result_type(signal_in.dtype, np.float32)
+    _, _, padlen = _sos_state(order, low, high, dtype.str)
+
+    ext = _odd_extend(signal_in.astype(dtype, copy=False), padlen)
+    n_fft = sp_fft.next_fast_len(ext.size, real=True)
+    spectrum = sp_fft.rfft(ext, n_fft)
+    spectrum *= _zero_phase_gain(order, low, high, n_fft)
+    filtered = sp_fft.irfft(spectrum, n_fft)[padlen : padlen + signal_in.shape[-1]]
+    return filtered.astype(dtype, copy=False)
+
+
 def apply_bandpass_filter(
     signal_in: np.ndarray,
     fs: float,
     lowcut: float,
     highcut: float,
     order: int = 4,
+    method: str = "auto",
 ) -> np.ndarray:
-    """Apply a Butterworth bandpass filter to the ECG signal."""
+    """Apply a zero-phase Butterworth bandpass filter to the ECG signal.
 
+    ``method`` selects ``"sos"`` (forward-backward second-order sections,
+    as ``scipy.signal.sosfiltfilt``), ``"fft"`` (the squared frequency
+    response applied to the spectrum), or ``"auto"``, which uses the FFT path
+    for signals of at least ``_FFT_FILTER_MIN_SAMPLES`` samples.
+    ``signal_in`` must be 1D; float32 input stays float32.
+    """
+
+    signal_in = np.asarray(signal_in)
+    if signal_in.ndim != 1:
+        raise ValueError("signal_in must be 1D")
     if lowcut <= 0 or highcut <= 0:
         raise ValueError("Cutoff frequencies must be positive")
     if highcut <= lowcut:
         raise ValueError("highcut must be greater than lowcut")
+    if method not in ("auto", "sos", "fft"):
+        raise ValueError("method must be 'auto', 'sos', or 'fft'")
 
     nyquist = 0.5 * fs
-    low = lowcut / nyquist
-    high = highcut / nyquist
-    b, a = signal.butter(order, [low, high], btype="bandpass")
-    return signal.filtfilt(b, a, signal_in)
+    # Rounding keeps float jitter from slider values out of the design cache key.
+    low = round(float(lowcut / nyquist), 6)
+    high = round(float(highcut / nyquist), 6)
+
+    _, _, padlen = _sos_state(int(order), low, high, np.result_type(signal_in.dtype, np.float32).str)
+    if signal_in.shape[-1] <= padlen:
+        raise ValueError(
+            f"The length of signal_in must be greater than the filter pad length, which is {padlen}."
+        )
+
+    if method == "fft" or (method == "auto" and signal_in.shape[-1] >= _FFT_FILTER_MIN_SAMPLES):
+        return _fft_filtfilt(int(order), low, high, signal_in)
+    return _sosfiltfilt(int(order), low, high, signal_in)
+
+
+@lru_cache(maxsize=8)
+def _fixed_time_inputs(duration_s: float, fs: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the time base and unit drift, which depend only on ``(duration_s, fs)``.
+
+    Both arrays are shared between calls and are marked read-only.
+    """
+
+    time = create_time_base(duration_s, fs)
+    drift = _unit_drift(time)
+    time.setflags(write=False)
+    drift.setflags(write=False)
+    return time, drift
+
+
+@lru_cache(maxsize=8)
+def _fixed_noise(n_samples: int, seed: int) -> np.ndarray:
+    """Return ``generate_noise(n_samples, seed)``, drawn once and marked read-only."""
+
+    noise = generate_noise(n_samples, seed)
+    noise.setflags(write=False)
+    return noise
 
 
 def run_simulation(
@@ -134,10 +462,36 @@ def run_simulation(
     noise_level: float,
     baseline_wander: float,
     seed: int | None = None,
+    precomputed_noise: np.ndarray | None = None,
 ) -> SimulationResult:
-    """Convenience wrapper that returns time, heart-rate, and ECG arrays."""
+    """Convenience wrapper that returns time, heart-rate, and ECG arrays.
 
-    time = create_time_base(duration_s, fs)
-    hr = simulate_heart_rate(time, hr_rest, hr_peak, stress_level)
-    ecg = generate_ecg_signal(time, hr, noise_level, baseline_wander, seed)
-    return SimulationResult(time=time, heart_rate=hr, ecg_raw=ecg)
+    The time base, baseline drift shape, and (for a fixed ``seed``) the noise
+    draw depend only on ``duration_s``, ``fs``, and ``seed``. They are computed
+    once per combination and reused, so repeated runs only redo the
+    heart-rate-dependent work.
+    """
+
+    n_samples = _num_samples(duration_s, fs)
+    if n_samples < 2:
+        raise ValueError("duration_s * fs must give at least two samples")
+    if precomputed_noise is not None and precomputed_noise.shape != (n_samples,):
+        raise ValueError("precomputed_noise must match time in length")
+    if precomputed_noise is None and seed is not None:
+        precomputed_noise = _fixed_noise(n_samples, seed)
+
+    time, unit_drift = _fixed_time_inputs(duration_s, fs)
+    result = SimulationResult(n_samples)
+    np.copyto(result.time, time)
+    simulate_heart_rate(result.time, hr_rest, hr_peak, stress_level, out=result.heart_rate)
+    _synthesize_ecg(
+        result.time,
+        result.heart_rate,
+        noise_level,
+        baseline_wander,
+        seed,
+        precomputed_noise,
+        result.ecg_raw,
+        unit_drift,
+    )
+    return result
@@ -1,6 +1,7 @@
 """Helper utilities for classification, summaries, and quick metrics."""
 from __future__ import annotations
 
+import math
 from typing import Dict, Tuple
 
 import numpy as np
@@ -19,11 +20,18 @@ def compute_hr_metrics(heart_rate: np.ndarray) -> Dict[str, float]:
     if heart_rate.size == 0:
         raise ValueError("heart_rate array must not be empty")
 
+    # Mean and std come from one sum and one dot product instead of the
+    # mean/subtract/square/sum passes np.std makes. Accumulating in float64
+    # keeps E[x^2] - E[x]^2 accurate for float32 traces.
+    hr = np.asarray(heart_rate, dtype=np.float64).ravel()
+    mean = float(np.sum(hr)) / hr.size
+    var = float(np.dot(hr, hr)) / hr.size - mean * mean
+
     metrics = {
-        "mean": float(np.mean(heart_rate)),
-        "min": float(np.min(heart_rate)),
-        "max": float(np.max(heart_rate)),
-        "std": float(np.std(heart_rate)),
+        "mean": mean,
+        "min": float(np.min(hr)),
+        "max": float(np.max(hr)),
+        "std": math.sqrt(max(var, 0.0)),
     }
     return metrics
 